@@ -1,6 +1,6 @@
-// const NA_MAP: &[(u32, &'static str)] = &[
-//     (0xAC00, "GA"),
-// ];
+// na_table::na_index(cp) is an index of a name. Name i is
+// NA_POOL[NA_OFFSETS[i]..NA_OFFSETS[i + 1]].
+// Index 0 is an empty string for the code points without name.
 pub(self) mod na_table;
 
 use crate::unicode::hangul;
@@ -51,9 +51,8 @@ pub(crate) fn na(cp: u32) -> String {
         return format!("CJK COMPATIBILITY IDEOGRAPH-{:04X}", cp);
     }
 
-    let found = na_table::NA_MAP.binary_search_by_key(&cp, |&(k,_)| k);
-    match found {
-        Ok(idx) => String::from(na_table::NA_MAP[idx].1),
-        Err(_) => String::from(""),
-    }
+    let idx = na_table::na_index(cp) as usize;
+    let start = na_table::NA_OFFSETS[idx] as usize;
+    let end = na_table::NA_OFFSETS[idx + 1] as usize;
+    String::from(&na_table::NA_POOL[start..end])
 }
\ No newline at end of file
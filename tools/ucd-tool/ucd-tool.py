@@ -2,7 +2,10 @@
 import os
 import json
 import re
-from typing import List, Tuple, Dict
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, List, Tuple, Dict, Optional
 
 from ucd.unicode import UNICODE_VERSION_MAJOR, UNICODE_VERSION_MINOR, UNICODE_VERSION_UPDATE
 from ucd.unicode import EMOJI_VERSION_MAJOR, EMOJI_VERSION_MINOR
@@ -15,7 +18,7 @@ UNICODE_DATA_DIR = 'data/{}.{}.{}'.format(
     UNICODE_VERSION_UPDATE
 )
 
-property_info = {
+property_info: Dict[str, Dict[str, int]] = {
     'bc': {
         'repr_size': 1,
     },
@@ -45,36 +48,118 @@ property_info = {
     },
 }
 
+# Binary properties having at least this many ranges are looked up by binary
+# search over a range table instead of a chain of range tests.
+BINARY_SEARCH_MIN_RANGES = 8
+
+# Bound format methods of the rows emitted in loops.
+_fmt_if_range = '    if (0x{:04X}..0x{:04X} + 1).contains(&cp) {{\n        return true;\n    }}\n'.format
+_fmt_range_row = '    (0x{:04X}, 0x{:04X}),\n'.format
+_fmt_cp_str_row = '    (0x{:04X}, "{}"),\n'.format
+_fmt_rdm_row = '    ("{}", 0x{}),\n'.format
+_fmt_cp_row = '    0x{:04X},\n'.format
+_fmt_code_escape = '\\u{{{}}}'.format
+
+
+@lru_cache(maxsize=16)
+def _load_json(filename: str) -> Any:
+    """Load a JSON file in UNICODE_DATA_DIR. Parsed data is cached and shared,
+so callers must not modify it."""
+    with open(os.path.join(UNICODE_DATA_DIR, filename)) as f:
+        return json.load(f)
+
+
+property_aliases = _load_json('PropertyAliases.json')
+property_value_aliases = _load_json('PropertyValueAliases.json')
+
+
+@lru_cache(maxsize=None)
+def _parse_range(r: str) -> CodePointRange:
+    """Memoized CodePointRange.parse."""
+    return CodePointRange.parse(r)
+
+
+# Code point ranges whose names are derived by rule (NR1, NR2) and so are not
+# stored in the name table.
+derived_na_ranges = [
+    # `HANGUL SYLLABLE` prefix.
+    _parse_range('AC00..D7A3'),
+    # `CJK UNIFIED IDEOGRAPH-` prefix.
+    _parse_range('3400..4DBF'),
+    _parse_range('4E00..9FFC'),
+    _parse_range('20000..2A6DD'),
+    _parse_range('2A700..2B734'),
+    _parse_range('2B740..2B81D'),
+    _parse_range('2B820..2CEA1'),
+    _parse_range('2CEB0..2EBE0'),
+    _parse_range('30000..3134A'),
+    # `TANGUT IDEOGRAPH-` prefix.
+    _parse_range('17000..187F7'),
+    _parse_range('18D00..18D08'),
+    # `KHITAN SMALL SCRIPT CHARACTER-` prefix.
+    _parse_range('18B00..18CD5'),
+    # `NUSHU CHARACTER-` prefix.
+    _parse_range('1B170..1B2FB'),
+    # `CJK COMPATIBILITY IDEOGRAPH-` prefix.
+    _parse_range('F900..FA6D'),
+    _parse_range('FA70..FAD9'),
+    _parse_range('2F800..2FA1D'),
+]
+
+# Sorted starts and aligned ends of derived_na_ranges for bisect lookup.
+_na_starts = []
+_na_ends = []
+for rng in sorted(derived_na_ranges, key=lambda x: x.start):
+    _na_starts.append(rng.start)
+    _na_ends.append(rng.end)
+
+_inverse_cache: Dict[str, Dict[str, str]] = {}
+_inverse_ci_cache: Dict[int, Dict[str, str]] = {}
+
+# Translation tables for delimiter normalization.
+_NORMTAB = str.maketrans({'-': ' ', '_': ' '})
+_BLK_DELIMTAB = str.maketrans({' ': '_', '-': '_'})
+
+# Decomposition type tag of a decomposition mapping, e.g. `<compat> `.
+_ANGLE_RE = re.compile(r'<.+> ')
+
+
+def find_key_by_value(d: Dict[str, str], val: str) -> str:
+    for k, v in d.items():
+        if v == val:
+            return k
+    raise KeyError(val)
 
-with open(os.path.join(UNICODE_DATA_DIR, 'PropertyAliases.json')) as f:
-    property_aliases = json.load(f)
 
-with open(os.path.join(UNICODE_DATA_DIR, 'PropertyValueAliases.json')) as f:
-    property_value_aliases = json.load(f)
+def _inverse(prop: str) -> Dict[str, str]:
+    """Return the (full_name -> abbr_name) mapping of the property value aliases.
+The mapping is built once per property and cached."""
+    inv = _inverse_cache.get(prop)
+    if inv is None:
+        inv = {v: k for k, v in property_value_aliases[prop].items()}
+        _inverse_cache[prop] = inv
 
+    return inv
 
-def find_key_by_value(d: Dict, val: str) -> str:
-    for k, v in d.items():
-        if v == val:
-            return k
 
+def _normalize_ci(val: str) -> str:
+    return val.translate(_NORMTAB).upper()
 
-def find_key_by_value_ci(d: Dict, val: str) -> str:
-    """Case insensitive version of find_key_by_value function."""
-    for k, v in d.items():
-        value = val.replace('-', ' ')
-        value = value.replace('_', ' ')
-        value = value.upper()
 
-        cmp_val = v.replace('_', ' ')
-        cmp_val = cmp_val.replace('-', ' ')
-        cmp_val = cmp_val.upper()
+def find_key_by_value_ci(d: Dict[str, str], val: str) -> str:
+    """Case insensitive version of find_key_by_value function.
+The normalized inverse of d is built once and cached by id(d)."""
+    norm_inv = _inverse_ci_cache.get(id(d))
+    if norm_inv is None:
+        norm_inv = {}
+        for k, v in d.items():
+            norm_inv.setdefault(_normalize_ci(v), k)
+        _inverse_ci_cache[id(d)] = norm_inv
 
-        if value == cmp_val:
-            return k
+    return norm_inv[_normalize_ci(val)]
 
 
-def to_snake_case(val: str):
+def to_snake_case(val: str) -> str:
     if val == 'ExtPict':
         return 'ext_pict'
 
@@ -90,103 +175,77 @@ def to_pascal_case(val: str) -> str:
 
 
 def str_as_escaped(s: str) -> str:
-    escaped = ''
-    for ch in s:
-        escaped += '\\u{{{:04X}}}'.format(ord(ch))
+    fmt = '\\u{{{:04X}}}'.format
 
-    return escaped
+    return ''.join(map(fmt, map(ord, s)))
 
 
-def data_value_as_abbr(data: List[Tuple[CodePointRange, str]], prop: str):
+def _abbr_via(prop: str) -> Callable[[str], str]:
     """Some property data file using (range, full_name) pair instead of (range, abbr_name).
-This function converts these data to abbr version."""
-    aliases = property_value_aliases[prop]
-    new_data = []
-    for pair in data:
-        new_pair = (pair[0], find_key_by_value(aliases, pair[1]))
-        new_data.append(new_pair)
-
-    return new_data
+Returns a value_transform of make_data which converts full name to abbr."""
+    return _inverse(prop).__getitem__
 
 
-def data_value_as_abbr_ccc(data: List[Tuple[CodePointRange, str]]):
-    aliases = property_value_aliases['ccc']
-    new_data = []
-    for pair in data:
-        new_pair = (pair[0], aliases[pair[1]])
-        new_data.append(new_pair)
+def _ccc_abbr(value: str) -> str:
+    return property_value_aliases['ccc'][value]
 
-    return new_data
 
+def _blk_abbr(value: str) -> str:
+    """Specialized version of _abbr_via for Block property."""
+    # Replace all delimiter to underscore.
+    value = value.translate(_BLK_DELIMTAB)
+    key = find_key_by_value_ci(property_value_aliases['blk'], value)
 
-def data_value_as_abbr_blk(data: List[Tuple[CodePointRange, str]]):
-    """Specialized version function for Block property."""
-    aliases = property_value_aliases['blk']
-    new_data = []
-    for pair in data:
-        # Replace all delimiter to underscore.
-        value = pair[1].replace(' ', '_')
-        value = value.replace('-', '_')
+    return to_pascal_case(key)
 
-        key = find_key_by_value_ci(aliases, value)
 
-        new_pair = (pair[0], to_pascal_case(key))
-        new_data.append(new_pair)
+def _age_name(value: str) -> str:
+    """Value transform for age property."""
+    ver = value.split('.')
 
-    return new_data
+    return 'V{}_{}'.format(ver[0], ver[1])
 
 
-def select_minimal_tst(prop: str, data: List[Tuple[CodePointRange, str]], repr_size: int, default_prop: str=None) -> TwoStageTable:
-    print('Select minimal table for: {}'.format(prop))
-    tables = {64: None, 128: None, 256: None, 512: None}
-    for block_size in tables.keys():
+def select_minimal_tst(prop: str, data: List[Tuple[CodePointRange, str]], repr_size: int, default_prop: Optional[str]=None) -> TwoStageTable:
+    # Print the report at once, since tables may be selected in parallel.
+    report = ['Select minimal table for: {}'.format(prop)]
+    tables: Dict[int, Tuple[TwoStageTable, int]] = {}
+    for block_size in (64, 128, 256, 512):
         tst = TwoStageTable.make(prop, data, block_size, default_prop)
-        print('Block size {}: {}'.format(block_size, tst.table_bytes(repr_size)))
-        tables[block_size] = tst
-    print('----------------------------')
+        table_bytes = tst.table_bytes(repr_size)
+        report.append('Block size {}: {}'.format(block_size, table_bytes))
+        tables[block_size] = (tst, table_bytes)
+    report.append('----------------------------')
+    print('\n'.join(report))
 
-    return min(tables.values(), key=lambda x: x.table_bytes(repr_size))
+    return min(tables.values(), key=lambda x: x[1])[0]
 
 
-def make_data(filename: str):
+def make_data(filename: str, *, value_transform: Optional[Callable[[str], str]]=None,
+        sort: bool=True) -> List[Tuple[CodePointRange, str]]:
     """Make data used by argument of two-stage table.
-filename: str - Path of JSON file."""
-    filename = os.path.join(UNICODE_DATA_DIR, filename)
-    f = open(filename)
-    json_str = f.read()
-    f.close()
-    d = json.loads(json_str)
-    data = []
-    for k, v in d.items():
-        cp_range = CodePointRange.parse(k)
-        data.append((cp_range, v))
-    data = sorted(data, key=lambda x: x[0])
+filename: str - Path of JSON file.
+value_transform: Function applied to each value while reading, e.g. _abbr_via('sc').
+sort: Sort the data by code point range."""
+    d = _load_json(filename)
+    if value_transform is None:
+        data = [(_parse_range(k), v) for k, v in d.items()]
+    else:
+        data = [(_parse_range(k), value_transform(v)) for k, v in d.items()]
+    if sort is True:
+        data.sort(key=itemgetter(0))
 
     return data
 
 
-def to_age_data(data: List[Tuple[CodePointRange, str]]):
-    """Use this function after make_data for age property."""
-    new_data = []
-    for pair in data:
-        ver = pair[1].split('.')
-        new_data.append((pair[0], 'V{}_{}'.format(ver[0], ver[1])))
-
-    return new_data
-
-
-def make_grouped_data(filename: str):
+def make_grouped_data(filename: str) -> Dict[str, List[Tuple[CodePointRange, str]]]:
     """e.g. emoji/emoji-data.json"""
-    filename = os.path.join(UNICODE_DATA_DIR, filename)
-    f = open(filename)
-    json_str = f.read()
-    f.close()
-    d = json.loads(json_str)
-    data_dict = {}
+    d = _load_json(filename)
+    data_dict: Dict[str, List[Tuple[CodePointRange, str]]] = {}
     for prop, ranges in d.items():
         data_dict[prop] = []
         for rng in ranges:
-            rng = CodePointRange.parse(rng)
+            rng = _parse_range(rng)
             data_dict[prop].append((rng, "true"))
         data_dict[prop] = sorted(data_dict[prop], key=lambda x: x[0])
 
@@ -194,202 +253,216 @@ def make_grouped_data(filename: str):
 
 
 def binary_props_rs() -> str:
-    filename = os.path.join(UNICODE_DATA_DIR, 'PropList.json')
-    f = open(filename)
-    json_str = f.read()
-    f.close()
-    d = json.loads(json_str)
-    txt = ''
-    prev_prop = ''
+    d = _load_json('PropList.json')
+    property_aliases_inv = {v: k for k, v in property_aliases.items()}
+    fns: List[str] = []
+    use_ordering = False
     for k, ranges in d.items():
-        # Closing function.
-        if prev_prop != k and prev_prop != '':
-            txt += '\n    false\n'
-            txt += '}\n\n'
-        # Opening function.
-        if prev_prop != k:
-            fn_name = ''
-            for alias, long in property_aliases.items():
-                if long == k:
-                    fn_name = to_snake_case(alias)
-            txt += 'pub(crate) fn {fn_name}(cp: u32) -> bool {{\n'.format(fn_name=fn_name)
-        for r in ranges:
-            r = CodePointRange.parse(r)
-            txt += '    if (0x{:04X}..0x{:04X} + 1).contains(&cp) {{\n'.format(r.start, r.end)
-            txt += '        return true;\n'
-            txt += '    }\n'
-        prev_prop = k
-    txt += '\n    false\n'
-    txt += '}\n'
+        fn_name = to_snake_case(property_aliases_inv[k])
+        ranges = sorted((_parse_range(r) for r in ranges), key=lambda x: x.start)
+        parts: List[str] = []
+        append = parts.append
+        if len(ranges) < BINARY_SEARCH_MIN_RANGES:
+            # Few ranges. Linear test is cheaper than binary search.
+            append('pub(crate) fn {fn_name}(cp: u32) -> bool {{\n'.format(fn_name=fn_name))
+            for r in ranges:
+                append(_fmt_if_range(r.start, r.end))
+            append('\n    false\n')
+            append('}\n')
+        else:
+            use_ordering = True
+            # Ranges in BMP are stored as u16 pairs, the rest as u32 pairs.
+            ranges_16: List[Tuple[int, int]] = []
+            ranges_32: List[Tuple[int, int]] = []
+            for r in ranges:
+                if r.end <= 0xFFFF:
+                    ranges_16.append((r.start, r.end))
+                elif r.start > 0xFFFF:
+                    ranges_32.append((r.start, r.end))
+                else:
+                    ranges_16.append((r.start, 0xFFFF))
+                    ranges_32.append((0x10000, r.end))
+            ranges_name = '{}_RANGES'.format(fn_name.upper())
+            if len(ranges_16) > 0:
+                append('const {}_16: &[(u16, u16)] = &[\n'.format(ranges_name))
+                for start, end in ranges_16:
+                    append(_fmt_range_row(start, end))
+                append('];\n\n')
+            if len(ranges_32) > 0:
+                append('const {}_32: &[(u32, u32)] = &[\n'.format(ranges_name))
+                for start, end in ranges_32:
+                    append(_fmt_range_row(start, end))
+                append('];\n\n')
+            search_16 = '{}_16.binary_search_by(|r| range_cmp(r, cp as u16)).is_ok()'.format(ranges_name)
+            search_32 = '{}_32.binary_search_by(|r| range_cmp(r, cp)).is_ok()'.format(ranges_name)
+            append('pub(crate) fn {fn_name}(cp: u32) -> bool {{\n'.format(fn_name=fn_name))
+            if len(ranges_32) == 0:
+                append('    cp <= 0xFFFF && {}\n'.format(search_16))
+            elif len(ranges_16) == 0:
+                append('    cp > 0xFFFF && {}\n'.format(search_32))
+            else:
+                append('    if cp <= 0xFFFF {\n')
+                append('        {}\n'.format(search_16))
+                append('    } else {\n')
+                append('        {}\n'.format(search_32))
+                append('    }\n')
+            append('}\n')
+        fns.append(''.join(parts))
+    txt = '\n'.join(fns)
+    if use_ordering is True:
+        header = 'use std::cmp::Ordering;\n\n'
+        header += 'fn range_cmp<T: Ord>(range: &(T, T), cp: T) -> Ordering {\n'
+        header += '    if cp < range.0 {\n'
+        header += '        Ordering::Greater\n'
+        header += '    } else if cp > range.1 {\n'
+        header += '        Ordering::Less\n'
+        header += '    } else {\n'
+        header += '        Ordering::Equal\n'
+        header += '    }\n'
+        header += '}\n\n'
+        txt = header + txt
 
     return txt
 
 
 def na_table_rs() -> str:
-    filename = os.path.join(UNICODE_DATA_DIR, 'extracted/DerivedName.json')
-    f = open(filename)
-    json_str = f.read()
-    f.close()
-    d = json.loads(json_str)
-    txt = '#[allow(dead_code)]\n'
-    txt += 'pub(super) const NA_MAP: &[(u32, &\'static str)] = &[\n'
+    d = _load_json('extracted/DerivedName.json')
+    # Deduplicated name pool. Index 0 is for the code points without name.
+    names: List[str] = ['']
+    name_indices: Dict[str, int] = {'': 0}
+    data = []
     for k, name in d.items():
-        cp = CodePointRange.parse(k)
-        # Ignore `HANGUL SYLLABLE` prefix.
-        if cp.start in CodePointRange.parse('AC00..D7A3'):
-            continue
-        # Ignore `CJK UNIFIED IDEOGRAPH-` prefix.
-        if cp.start in CodePointRange.parse('3400..4DBF'):
-            continue
-        if cp.start in CodePointRange.parse('4E00..9FFC'):
-            continue
-        if cp.start in CodePointRange.parse('20000..2A6DD'):
-            continue
-        if cp.start in CodePointRange.parse('2A700..2B734'):
-            continue
-        if cp.start in CodePointRange.parse('2B740..2B81D'):
+        cp = _parse_range(k)
+        # Skip the names derived by rule.
+        idx = bisect_right(_na_starts, cp.start) - 1
+        if idx >= 0 and cp.start <= _na_ends[idx]:
             continue
-        if cp.start in CodePointRange.parse('2B820..2CEA1'):
-            continue
-        if cp.start in CodePointRange.parse('2CEB0..2EBE0'):
-            continue
-        if cp.start in CodePointRange.parse('30000..3134A'):
-            continue
-        # Ignore `TANGUT IDEOGRAPH-` prefix.
-        if cp.start in CodePointRange.parse('17000..187F7'):
-            continue
-        if cp.start in CodePointRange.parse('18D00..18D08'):
-            continue
-        # Ignore `KHITAN SMALL SCRIPT CHARACTER-` prefix.
-        if cp.start in CodePointRange.parse('18B00..18CD5'):
-            continue
-        # Ignore `NUSHU CHARACTER-` prefix.
-        if cp.start in CodePointRange.parse('1B170..1B2FB'):
-            continue
-        # Ignore `CJK COMPATIBILITY IDEOGRAPH-` prefix.
-        if cp.start in CodePointRange.parse('F900..FA6D') or \
-                cp.start in CodePointRange.parse('FA70..FAD9') or \
-                cp.start in CodePointRange.parse('2F800..2FA1D'):
-            continue
-        txt += '    (0x{:04X}, "{}"),\n'.format(cp.start, name)
-    txt += '];\n'
-
-    return txt
-
-
-def dm_map_rs():
-    filename = os.path.join(UNICODE_DATA_DIR, 'UnicodeData.json')
-    with open(filename) as f:
-        json_str = f.read()
-    unicode_data = json.loads(json_str)
-    # Make DM_MAP.
-    txt = 'pub(super) const DM_MAP: &[(u32, &str)] = &[\n'
+        name_idx = name_indices.get(name)
+        if name_idx is None:
+            name_idx = len(names)
+            name_indices[name] = name_idx
+            names.append(name)
+        data.append((cp, str(name_idx)))
+    data.sort(key=lambda x: x[0].start)
+    tst = select_minimal_tst('Na_Index', data, 2, default_prop='0')
+    parts: List[str] = []
+    append = parts.append
+    append(tst.to_seshat(value_type='u16'))
+    append('\n')
+    # All names in one string. Name i is NA_POOL[NA_OFFSETS[i]..NA_OFFSETS[i + 1]].
+    # Each line ends with a string continuation escape, so no newline is included.
+    offsets = [0, 0]
+    append('pub(super) const NA_POOL: &str = "\\\n')
+    for name in names[1:]:
+        append(name)
+        append('\\\n')
+        offsets.append(offsets[-1] + len(name.encode()))
+    append('";\n\n')
+    append('pub(super) const NA_OFFSETS: &[u32] = &[')
+    for i, offset in enumerate(offsets):
+        if i % 16 == 0:
+            append('\n   ')
+        append(' {},'.format(offset))
+    append('\n];\n')
+
+    return ''.join(parts)
+
+
+def dm_map_rs() -> str:
+    unicode_data = _load_json('UnicodeData.json')
+    # Walk UnicodeData once, collecting rows of both DM_MAP and RDM_MAP.
+    dm_list: List[Tuple[int, str]] = []
+    rdm_list: List[Tuple[str, str]] = []
     for k, props in unicode_data.items():
         dm_raw = props['dm']
         if dm_raw == '':
             continue
-        cp = CodePointRange.parse(k)
-        # Make dm_raw to str.
+        cp = _parse_range(k)
         if dm_raw.startswith('<'):
-            dm_raw = re.sub('<.+> ', '', dm_raw)
-        dm_str = ''
-        for code in dm_raw.split(' '):
-            dm_str += '\\u{{{}}}'.format(code)
-        txt += '    (0x{:04X}, "{}"),\n'.format(cp.start, dm_str)
-    txt += '];\n\n'
+            # Compatibility decompositions are not used for composition.
+            codes = _ANGLE_RE.sub('', dm_raw).split(' ')
+        else:
+            codes = dm_raw.split(' ')
+            rdm_list.append((''.join(chr(int(x, 16)) for x in codes), k))
+        dm_list.append((cp.start, ''.join(map(_fmt_code_escape, codes))))
+    rdm_list.sort(key=itemgetter(0))
+
+    parts: List[str] = []
+    append = parts.append
+    # Make DM_MAP.
+    append('pub(super) const DM_MAP: &[(u32, &str)] = &[\n')
+    for cp_start, dm_str in dm_list:
+        append(_fmt_cp_str_row(cp_start, dm_str))
+    append('];\n\n')
     # Make RDM_MAP.
-    rdm_list = []
-    txt += 'pub(super) const RDM_MAP: &[(&str, u32)] = &[\n'
-    for k, props in unicode_data.items():
-        dm_raw = props['dm']
-        if dm_raw == '':
-            continue
-        if dm_raw.startswith('<'):
-            continue
-            dm_raw = re.sub('<.+> ', '', dm_raw)
-        dm_str = ''.join(map(lambda x: chr(int(x, 16)), dm_raw.split(' ')))
-        rdm_list.append((dm_str, k))
-    rdm_list = sorted(rdm_list, key=lambda x: x[0])
+    append('pub(super) const RDM_MAP: &[(&str, u32)] = &[\n')
     for pair in rdm_list:
-        txt += '    ("{}", 0x{}),\n'.format(str_as_escaped(pair[0]), pair[1])
-    txt += '];\n'
+        append(_fmt_rdm_row(str_as_escaped(pair[0]), pair[1]))
+    append('];\n')
 
-    return txt
+    return ''.join(parts)
 
 
-def normalization_props_data_rs():
-    filename = os.path.join(UNICODE_DATA_DIR, 'DerivedNormalizationProps.json')
-    with open(filename) as f:
-        json_str = f.read()
-    normalization_props_data = json.loads(json_str)
+def normalization_props_data_rs() -> None:
+    normalization_props_data = _load_json('DerivedNormalizationProps.json')
     # Comp_Ex (Full_Composition_Exclusion)
     # NFD_QC
 
 
-def ce_rs():
-    filename = os.path.join(UNICODE_DATA_DIR, 'CompositionExclusions.json')
-    with open(filename) as f:
-        json_str = f.read()
-    ce_data = json.loads(json_str)
-    txt = 'const CE_LIST: &[u32] = &[\n'
+def ce_rs() -> str:
+    ce_data = _load_json('CompositionExclusions.json')
+    parts: List[str] = []
+    append = parts.append
+    append('const CE_LIST: &[u32] = &[\n')
     for code in ce_data:
-        txt += '    0x{:04X},\n'.format(CodePointRange.parse(code).start)
-    txt += '];\n\n'
-    txt += 'pub(crate) fn ce(cp: u32) -> bool {\n'
-    txt += '    if CE_LIST.contains(&cp) {\n'
-    txt += '        return true;\n'
-    txt += '    }\n'
-    txt += '    false\n'
-    txt += '}\n'
-    return txt
+        append(_fmt_cp_row(_parse_range(code).start))
+    append('];\n\n')
+    append('pub(crate) fn ce(cp: u32) -> bool {\n')
+    append('    if CE_LIST.contains(&cp) {\n')
+    append('        return true;\n')
+    append('    }\n')
+    append('    false\n')
+    append('}\n')
+    return ''.join(parts)
+
+
+def gc_rs() -> str:
+    gc_data = make_data('extracted/DerivedGeneralCategory.json')
+    tst = select_minimal_tst('Gc', gc_data, property_info['gc']['repr_size'])
 
+    return tst.to_seshat()
 
-if __name__ == '__main__':
-    from pprint import pprint
 
-    # Make gc data.
-    gc_data = make_data('extracted/DerivedGeneralCategory.json')
-    tst = select_minimal_tst('Gc', gc_data, property_info['gc']['repr_size'])
-    f = open('../../src/unicode/ucd/gc.rs', 'w')
-    f.write(tst.to_seshat())
-    f.close()
-    # Make blk data.
-    blk_data = make_data('Blocks.json')
-    blk_data = data_value_as_abbr_blk(blk_data)
+def blk_rs() -> str:
+    blk_data = make_data('Blocks.json', value_transform=_blk_abbr)
     tst = select_minimal_tst('Blk', blk_data, property_info['blk']['repr_size'], default_prop='Nb')
-    f = open('../../src/unicode/ucd/blk.rs', 'w')
-    f.write(tst.to_seshat())
-    f.close()
-    # Make sc data.
-    sc_data = make_data('Scripts.json')
-    sc_data = data_value_as_abbr(sc_data, 'sc')
+
+    return tst.to_seshat()
+
+
+def sc_rs() -> str:
+    sc_data = make_data('Scripts.json', value_transform=_abbr_via('sc'))
     tst = select_minimal_tst('Sc', sc_data, property_info['sc']['repr_size'], default_prop='Zzzz')
-    f = open('../../src/unicode/ucd/sc.rs', 'w')
-    f.write(tst.to_seshat())
-    f.close()
-    # Make age data.
-    age_data = make_data('DerivedAge.json')
-    age_data = to_age_data(age_data)
+
+    return tst.to_seshat()
+
+
+def age_rs() -> str:
+    age_data = make_data('DerivedAge.json', value_transform=_age_name)
     tst = select_minimal_tst('Age', age_data, property_info['age']['repr_size'], default_prop='NA')
-    f = open('../../src/unicode/ucd/age.rs', 'w')
-    f.write(tst.to_seshat())
-    f.close()
-    # Make binary properties data.
-    f = open('../../src/unicode/ucd/binary_props.rs', 'w')
-    f.write(binary_props_rs())
-    f.close()
-    # Make na data table.
-    f = open('../../src/unicode/ucd/na/na_table.rs', 'w')
-    f.write(na_table_rs())
-    f.close()
-    # Make hst properties data.
+
+    return tst.to_seshat()
+
+
+def hst_rs() -> str:
     hst_data = make_data('HangulSyllableType.json')
     tst = select_minimal_tst('Hst', hst_data, property_info['hst']['repr_size'], default_prop='NA')
-    f = open('../../src/unicode/ucd/hst.rs', 'w')
-    f.write(tst.to_seshat())
-    f.close()
-    # Make Emoji data properties data.
-    emoji_props_rs = ''
+
+    return tst.to_seshat()
+
+
+def emoji_props_rs() -> str:
+    txt = ''
     emoji_data_dict = make_grouped_data('emoji/emoji-data.json')
     for i, prop in enumerate(emoji_data_dict.keys()):
         use = False
@@ -397,35 +470,69 @@ if __name__ == '__main__':
             use = True
         prop_alias = to_snake_case(find_key_by_value(property_aliases, prop))
         tst = select_minimal_tst(prop_alias, emoji_data_dict[prop], 1, default_prop='false')
-        emoji_props_rs += tst.to_seshat(use=use, prefix=True, boolean=True)
-    with open('../../src/unicode/ucd/emoji_props.rs', 'w') as f:
-        f.write(emoji_props_rs)
-    # Make GCB data.
-    gcb_data = make_data('auxiliary/GraphemeBreakProperty.json')
-    gcb_data = data_value_as_abbr(gcb_data, "GCB")
+        txt += tst.to_seshat(use=use, prefix=True, boolean=True)
+
+    return txt
+
+
+def gcb_rs() -> str:
+    gcb_data = make_data('auxiliary/GraphemeBreakProperty.json', value_transform=_abbr_via('GCB'))
     tst = select_minimal_tst('Gcb', gcb_data, property_info['gcb']['repr_size'], default_prop='XX')
-    with open('../../src/unicode/ucd/gcb.rs', 'w') as f:
-        f.write(tst.to_seshat())
-    # Make bc data.
+
+    return tst.to_seshat()
+
+
+def bc_rs() -> str:
     bc_data = make_data('extracted/DerivedBidiClass.json')
     tst = select_minimal_tst('Bc', bc_data, property_info['bc']['repr_size'], default_prop='L')
-    with open('../../src/unicode/ucd/bc.rs', 'w') as f:
-        f.write(tst.to_seshat())
-    # Make ccc data.
-    ccc_data = make_data('extracted/DerivedCombiningClass.json')
-    ccc_data = data_value_as_abbr_ccc(ccc_data)
+
+    return tst.to_seshat()
+
+
+def ccc_rs() -> str:
+    ccc_data = make_data('extracted/DerivedCombiningClass.json', value_transform=_ccc_abbr)
     tst = select_minimal_tst('Ccc', ccc_data, property_info['ccc']['repr_size'], default_prop='NR')
-    with open('../../src/unicode/ucd/ccc.rs', 'w') as f:
-        f.write(tst.to_seshat())
-    # Make dt data.
-    dt_data = make_data('extracted/DerivedDecompositionType.json')
-    dt_data = data_value_as_abbr(dt_data, 'dt')
+
+    return tst.to_seshat()
+
+
+def dt_rs() -> str:
+    dt_data = make_data('extracted/DerivedDecompositionType.json', value_transform=_abbr_via('dt'))
     tst = select_minimal_tst('Dt', dt_data, property_info['dt']['repr_size'], default_prop='None')
-    with open('../../src/unicode/ucd/dt.rs', 'w') as f:
-        f.write(tst.to_seshat())
-    # Make dm data.
-    with open('../../src/unicode/ucd/dm/dm_map.rs', 'w') as f:
-        f.write(dm_map_rs())
-    # Make CE data.
-    with open('../../src/unicode/ucd/ce.rs', 'w') as f:
-        f.write(ce_rs())
\ No newline at end of file
+
+    return tst.to_seshat()
+
+
+# (output path, generator function) pairs. Each generator is independent of the
+# others, so they are run in separate processes.
+tasks = [
+    ('../../src/unicode/ucd/gc.rs', gc_rs),
+    ('../../src/unicode/ucd/blk.rs', blk_rs),
+    ('../../src/unicode/ucd/sc.rs', sc_rs),
+    ('../../src/unicode/ucd/age.rs', age_rs),
+    ('../../src/unicode/ucd/binary_props.rs', binary_props_rs),
+    ('../../src/unicode/ucd/na/na_table.rs', na_table_rs),
+    ('../../src/unicode/ucd/hst.rs', hst_rs),
+    ('../../src/unicode/ucd/emoji_props.rs', emoji_props_rs),
+    ('../../src/unicode/ucd/gcb.rs', gcb_rs),
+    ('../../src/unicode/ucd/bc.rs', bc_rs),
+    ('../../src/unicode/ucd/ccc.rs', ccc_rs),
+    ('../../src/unicode/ucd/dt.rs', dt_rs),
+    ('../../src/unicode/ucd/dm/dm_map.rs', dm_map_rs),
+    ('../../src/unicode/ucd/ce.rs', ce_rs),
+]
+
+
+def _run_task(task: Tuple[str, Callable[[], str]]) -> Tuple[str, str]:
+    path, fn = task
+
+    return path, fn()
+
+
+if __name__ == '__main__':
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        for path, txt in executor.map(_run_task, tasks):
+            with open(path, 'w') as f:
+                f.write(txt)
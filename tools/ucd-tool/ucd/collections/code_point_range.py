@@ -1,5 +1,8 @@
+from typing import Iterator, Optional
+
+
 class CodePointRange:
-    def __init__(self, start: int, end: int=None):
+    def __init__(self, start: int, end: Optional[int]=None):
         if end is None:
             end = start
 
@@ -10,38 +13,30 @@ class CodePointRange:
         self._end = end
 
     @property
-    def start(self):
+    def start(self) -> int:
         return self._start
 
     @property
-    def end(self):
+    def end(self) -> int:
         return self._end
 
-    def __lt__(self, other):
+    def __lt__(self, other: 'CodePointRange') -> bool:
         return (self.start < other.start) and (self.end < other.end)
 
-    def __gt__(self, other):
+    def __gt__(self, other: 'CodePointRange') -> bool:
         return (self.start > other.start) and (self.end > other.end)
 
-    def __contains__(self, cp: int):
+    def __contains__(self, cp: int) -> bool:
         return self.start <= cp <= self.end
 
-    def __iter__(self):
-        self._iter_i = self.start - 1
-        return self
-
-    def __next__(self):
-        if self._iter_i < self.end:
-            self._iter_i += 1
-            return self._iter_i
-        else:
-            raise StopIteration
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.end + 1))
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return '{:04X}..{:04X}'.format(self.start, self.end)
 
     @staticmethod
-    def parse(r: str):
+    def parse(r: str) -> 'CodePointRange':
         start = 0
         end = 0
 
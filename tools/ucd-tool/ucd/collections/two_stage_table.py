@@ -1,4 +1,5 @@
-from typing import List, Tuple, Dict
+from array import array
+from typing import List, Tuple, Dict, Optional
 
 from .code_point_range import CodePointRange
 
@@ -9,20 +10,23 @@ class TwoStageTable:
         self._block_size = block_size
 
         self._cur_cp = -1
-        self._cur_block = []
-        self._stage_1 = []
-        self._stage_2: List[Tuple] = []
-        self._blocks: Dict[Tuple, int] = {}
+        # Current block as value ids. Blocks are deduplicated by their bytes.
+        self._cur_block = array('I')
+        self._stage_1: List[int] = []
+        self._stage_2: List[Tuple[Optional[str], ...]] = []
+        self._blocks: Dict[bytes, int] = {}
+        self._values: List[Optional[str]] = []
+        self._value_ids: Dict[Optional[str], int] = {}
 
     @property
-    def prop(self):
+    def prop(self) -> str:
         return self._prop
 
     @property
-    def block_size(self):
+    def block_size(self) -> int:
         return self._block_size
 
-    def _int_size(self):
+    def _int_size(self) -> int:
         """Get minimal int size of index of stage-2."""
         if len(self._stage_2) <= 256:
             return 1
@@ -35,7 +39,7 @@ class TwoStageTable:
         else:
             raise ValueError('error! len(self._stage_2): {}'.format(len(self._stage_2)))
 
-    def _index_t(self):
+    def _index_t(self) -> str:
         return {
             1: 'u8',
             2: 'u16',
@@ -43,25 +47,42 @@ class TwoStageTable:
             8: 'u64',
         }[self._int_size()]
 
-    def add_char(self, cp: int, value: str):
+    def add_char(self, cp: int, value: Optional[str]) -> None:
         self._cur_cp = cp
-        self._cur_block.append(value)
-
-        if len(self._cur_block) == self.block_size:
-            block_tuple = tuple(self._cur_block)
-            idx = self._blocks.get(block_tuple)
-            # If not exists, add to stage-2.
-            if idx is None:
-                idx = len(self._stage_2)
-                self._blocks[block_tuple] = idx
-                self._stage_2.append(block_tuple)
-            self._stage_1.append(idx)
-            self._cur_block = []
-
-    def to_seshat(self, prefix=False, use=True, boolean=False) -> str:
+        self._add_run(value, 1)
+
+    def _add_run(self, value: Optional[str], count: int) -> None:
+        """Add count characters of the same value."""
+        value_id = self._value_ids.get(value)
+        if value_id is None:
+            value_id = len(self._values)
+            self._value_ids[value] = value_id
+            self._values.append(value)
+
+        while count > 0:
+            n = min(count, self.block_size - len(self._cur_block))
+            self._cur_block.extend(array('I', [value_id]) * n)
+            count -= n
+
+            if len(self._cur_block) == self.block_size:
+                block_bytes = self._cur_block.tobytes()
+                idx = self._blocks.get(block_bytes)
+                # If not exists, add to stage-2.
+                if idx is None:
+                    idx = len(self._stage_2)
+                    self._blocks[block_bytes] = idx
+                    self._stage_2.append(tuple(self._values[i] for i in self._cur_block))
+                self._stage_1.append(idx)
+                self._cur_block = array('I')
+
+    def to_seshat(self, prefix: bool=False, use: bool=True, boolean: bool=False, value_type: Optional[str]=None) -> str:
+        """value_type: Rust type of raw values (e.g. u16) to store instead of enum values."""
         txt = ''
+        raw = boolean is True or value_type is not None
+        if value_type is None:
+            value_type = 'bool' if boolean is True else self.prop
         if use is True:
-            if boolean is False:
+            if raw is False:
                 txt += 'use crate::unicode::props::{};\n'.format(self.prop)
             txt += 'use crate::collections::TwoStageTable;\n\n'
 
@@ -84,7 +105,7 @@ class TwoStageTable:
         # Stage-2
         txt += 'const {prefix}STAGE_2: &[&[{enum_type}]] = &['.format(
             prefix=prefix_lambda(prefix),
-            enum_type=(lambda x: self.prop if boolean is False else 'bool')(self.prop)
+            enum_type=value_type
             # block_size=self.block_size,
             # size=len(self._stage_2)
         )
@@ -94,7 +115,7 @@ class TwoStageTable:
             for j, val in enumerate(block):
                 if j % 8 == 0:
                     txt += '\n        '
-                if boolean is False:
+                if raw is False:
                     txt += '{}::{},'.format(self.prop, val)
                 else:
                     txt += '{},'.format(val)
@@ -105,11 +126,11 @@ class TwoStageTable:
 
         txt += 'pub(crate) fn {fn_name}(cp: u32) -> {prop} {{\n'.format(
             fn_name=self.prop.lower(),
-            prop=(lambda x: self.prop if boolean is False else 'bool')(self.prop)
+            prop=value_type
         )
         txt += '    let tst: TwoStageTable<{prop}, {index_t}> = TwoStageTable::new(&{prefix}STAGE_1, {prefix}STAGE_2, {block_size});\n'.format(
             prefix=prefix_lambda(prefix),
-            prop=(lambda x: self.prop if boolean is False else 'bool')(self.prop),
+            prop=value_type,
             index_t=self._index_t(),
             block_size=self.block_size
         )
@@ -126,24 +147,22 @@ class TwoStageTable:
         return stage_1_bytes + stage_2_bytes
 
     @staticmethod
-    def make(prop: str, data: List[Tuple[CodePointRange, str]], block_size: int, default_prop: str=None):
+    def make(prop: str, data: List[Tuple[CodePointRange, str]], block_size: int, default_prop: Optional[str]=None) -> 'TwoStageTable':
         tst = TwoStageTable(prop, block_size)
         cur_cp = 0
 
         for pair in data:
             # Fill default property for implicit ranges.
             if cur_cp not in pair[0]:
-                for cp in CodePointRange(cur_cp, pair[0].start - 1):
-                    tst.add_char(cur_cp, default_prop)
-                    cur_cp += 1
+                tst._add_run(default_prop, pair[0].start - cur_cp)
+                cur_cp = pair[0].start
             # Add each characters in range.
-            for cp in pair[0]:
-                tst.add_char(cur_cp, pair[1])
-                cur_cp += 1
+            tst._add_run(pair[1], pair[0].end - cur_cp + 1)
+            cur_cp = pair[0].end + 1
         # Fill default property for remains characters.
         if cur_cp <= 0x10FFFF:
-            for cp in CodePointRange(cur_cp, 0x10FFFF):
-                tst.add_char(cur_cp, default_prop)
-                cur_cp += 1
+            tst._add_run(default_prop, 0x110000 - cur_cp)
+            cur_cp = 0x110000
+        tst._cur_cp = cur_cp - 1
 
         return tst